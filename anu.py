@@ -1,17 +1,118 @@
 import os
 import csv
+import asyncio
+import functools
+import io
+import itertools
+import socket
+import time
 import requests
+import urllib3.util.connection
+from requests.adapters import HTTPAdapter
 from colorama import init, Fore, Style
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import sys
-import time
+
+# aiohttp is the default backend (installed by __main__ below); without it
+# the checks fall back to a thread pool
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# httpx (with h2) is optional; used only when the server speaks HTTP/2
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# uvloop is optional (not available on Windows); faster drop-in event loop
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 # Initialize colorama for colored text
 init(autoreset=True)
 
+# Certificate URL, filled in with (event_code, filename) on the hot path
+BASE_URL = "https://bbpvpbekasi.kemnaker.go.id"
+URL_TMPL = BASE_URL + "/bulanvokasi/sertifikatbv/%s/%s.pdf"
+
+# Shared HTTP session for the thread-pool fallback: checks reuse pooled
+# keep-alive TLS connections instead of doing a fresh handshake per email.
+# urllib3 does not retry here; head_with_retries does, so that backing off
+# never ties up a worker thread.
+MAX_RETRIES = 5
+MAX_WORKERS = 16
+RETRY_STATUSES = (502, 503, 504)
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=64,
+    max_retries=0,
+))
+SESSION.headers.update({
+    "Connection": "keep-alive",
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                  "(KHTML, like Gecko) Chrome/120.0 Safari/537.36",
+})
+
+# The target host never changes, so resolve it once and reuse the answer for
+# DNS_TTL seconds instead of calling getaddrinfo for every new connection.
+DNS_TTL = 300
+# aiohttp keeps its own resolver cache; entries there live this long
+AIOHTTP_DNS_TTL = 600
+
+@functools.lru_cache(maxsize=16)
+def _cached_getaddrinfo(host, port, family, ttl_bucket):
+    """getaddrinfo memoized per (host, port, family) for one DNS_TTL window"""
+    return socket.getaddrinfo(host, port, family, socket.SOCK_STREAM)
+
+def _create_connection_cached(address, timeout=None, source_address=None, socket_options=None):
+    """urllib3 create_connection that connects to cached addresses"""
+    host, port = address
+    if host.startswith('['):
+        host = host.strip('[]')
+    # Respect urllib3's IPv4/IPv6 preference (no AAAA lookups on IPv4-only hosts)
+    family = urllib3.util.connection.allowed_gai_family()
+    infos = _cached_getaddrinfo(host, port, family, int(time.monotonic() // DNS_TTL))
+    
+    err = None
+    for af, socktype, proto, _, sockaddr in infos:
+        sock = None
+        try:
+            sock = socket.socket(af, socktype, proto)
+            for opt in socket_options or ():
+                sock.setsockopt(*opt)
+            # urllib3 passes a sentinel object for "use the default timeout"
+            if timeout is None or isinstance(timeout, (int, float)):
+                sock.settimeout(timeout)
+            if source_address:
+                sock.bind(source_address)
+            # Full sockaddr, so IPv6 flowinfo and scope_id are kept
+            sock.connect(sockaddr)
+            return sock
+        except OSError as e:
+            err = e
+            if sock is not None:
+                sock.close()
+    
+    if err is not None:
+        raise err
+    raise OSError("getaddrinfo returns an empty list")
+
+urllib3.util.connection.create_connection = _create_connection_cached
+
+def format_colored(text, color=Fore.WHITE, emoji=""):
+    """Format colored text with optional emoji as one output line"""
+    return f"{emoji} {color}{text}{Style.RESET_ALL}\n"
+
 def print_colored(text, color=Fore.WHITE, emoji=""):
     """Print colored text with optional emoji"""
-    print(f"{emoji} {color}{text}{Style.RESET_ALL}")
+    sys.stdout.write(format_colored(text, color, emoji))
 
 def email_to_filename(email):
     """Convert email to filename format like dellaramadhanty26_gmail.com"""
@@ -25,51 +126,215 @@ def email_to_filename(email):
     # Return as-is
     return email
 
-def check_pdf_exists(email, event_code, max_retries=5, retry_delay=5):
-    """Check if PDF exists for given email and event code with retry mechanism"""
-    # Convert email to filename format
-    email_filename = email_to_filename(email)
+class AdaptiveLimiter:
+    """Concurrency limit shared by all checks of an event that shrinks while errors spike
+    
+    Every finished attempt is recorded. When more than `threshold` of the
+    attempts in the last `window` seconds failed, the limit drops by one (down
+    to `min_limit`); while things are healthy it grows back to `max_limit`.
+    """
+    
+    def __init__(self, max_limit, min_limit=2, window=10, threshold=0.25):
+        self.limit = self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.window = window
+        self.threshold = threshold
+        self.active = 0
+        self.events = deque()  # (timestamp, ok) of recent attempts
+        self.cond = asyncio.Condition()
+    
+    async def __aenter__(self):
+        async with self.cond:
+            await self.cond.wait_for(lambda: self.active < self.limit)
+            self.active += 1
     
-    # Construct the URL
-    url = f"https://bbpvpbekasi.kemnaker.go.id/bulanvokasi/sertifikatbv/{event_code}/{email_filename}.pdf"
+    async def __aexit__(self, *exc):
+        async with self.cond:
+            self.active -= 1
+            self.cond.notify_all()
     
-    for attempt in range(1, max_retries + 1):
+    async def record(self, ok):
+        """Record an attempt's outcome and adjust the limit"""
+        now = time.monotonic()
+        self.events.append((now, ok))
+        while self.events[0][0] < now - self.window:
+            self.events.popleft()
+        
+        error_rate = sum(1 for _, e_ok in self.events if not e_ok) / len(self.events)
+        if error_rate > self.threshold:
+            self.limit = max(self.min_limit, self.limit - 1)
+        elif ok and self.limit < self.max_limit:
+            async with self.cond:
+                self.limit += 1
+                # Wake waiters now rather than on the next release
+                self.cond.notify_all()
+
+async def head_with_retries(limiter, url, head):
+    """Check url with one head(url) per attempt, retrying transient failures
+    
+    head returns the HTTP status, or a (message, retryable) pair when the
+    request itself failed. The limiter slot is held only for each attempt,
+    never during the backoff, so other URLs keep being checked meanwhile.
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        if attempt:
+            await asyncio.sleep(2 ** (attempt - 1))
+        async with limiter:
+            outcome = await head(url)
+        
+        if isinstance(outcome, tuple):
+            message, retryable = outcome
+            if not retryable:
+                # Not a sign of server load, so it doesn't move the limit
+                return False, url, message
+            await limiter.record(False)
+            continue
+        
+        if outcome in RETRY_STATUSES:
+            await limiter.record(False)
+            message = f"HTTP Status: {outcome}"
+            continue
+        await limiter.record(True)
+        
+        if outcome == 200:
+            # The URL always ends in .pdf, so a 200 is authoritative
+            return True, url, "PDF exists"
+        else:
+            return False, url, f"HTTP Status: {outcome}"
+    
+    return False, url, f"{message} (failed after {MAX_RETRIES} retries)"
+
+async def check_pdf_async(session, limiter, filename, event_code):
+    """Check one filename over a shared aiohttp session"""
+    async def head(url):
         try:
-            response = requests.head(url, timeout=10, allow_redirects=True)
-            
-            if response.status_code == 200:
-                # Also check if it's actually a PDF by looking at content-type
-                content_type = response.headers.get('content-type', '').lower()
-                if 'pdf' in content_type:
-                    return True, url, "PDF exists"
-                else:
-                    return False, url, "URL exists but not a PDF"
-            else:
-                return False, url, f"HTTP Status: {response.status_code}"
-                
+            async with session.head(url, allow_redirects=True, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                return response.status
+        except asyncio.TimeoutError:
+            return "Connection timeout", True
+        except aiohttp.ClientConnectionError:
+            return "Connection error", True
+        except aiohttp.ClientError as e:
+            return f"Request error: {str(e)}", False
+    
+    return await head_with_retries(limiter, URL_TMPL % (event_code, filename), head)
+
+async def check_all_async(filenames, event_code):
+    """Check all filenames concurrently over one pooled aiohttp session"""
+    try:
+        # Non-blocking resolver, only available when aiodns is installed
+        resolver = aiohttp.AsyncResolver()
+    except RuntimeError:
+        resolver = None
+    connector = aiohttp.TCPConnector(limit=32, limit_per_host=32, resolver=resolver,
+                                     ttl_dns_cache=AIOHTTP_DNS_TTL, keepalive_timeout=60)
+    limiter = AdaptiveLimiter(MAX_WORKERS)
+    async with aiohttp.ClientSession(connector=connector, headers=SESSION.headers) as session:
+        return await asyncio.gather(*(check_pdf_async(session, limiter, f, event_code) for f in filenames))
+
+# Whether the server speaks HTTP/2; probed once, then reused for every event
+_http2_supported = None
+
+async def open_http2_client():
+    """Return an httpx client if the server negotiates HTTP/2, otherwise None"""
+    global _http2_supported
+    if _http2_supported is False:
+        return None
+    
+    try:
+        client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=4, max_connections=4),
+            timeout=10.0,
+            # Connection-specific headers like keep-alive are invalid in HTTP/2
+            headers={"User-Agent": SESSION.headers["User-Agent"]},
+        )
+    except ImportError:
+        # The h2 package is not installed
+        _http2_supported = False
+        return None
+    
+    if _http2_supported:
+        return client
+    
+    try:
+        response = await client.head(BASE_URL + "/")
+    except httpx.HTTPError:
+        _http2_supported = False
+        await client.aclose()
+        return None
+    
+    _http2_supported = response.http_version == "HTTP/2"
+    if not _http2_supported:
+        # Server negotiated down to HTTP/1.1, aiohttp is faster there
+        await client.aclose()
+        return None
+    return client
+
+async def check_pdf_http2(client, limiter, filename, event_code):
+    """Check one filename over a multiplexed HTTP/2 client"""
+    async def head(url):
+        try:
+            response = await client.head(url, follow_redirects=True)
+            return response.status_code
+        except httpx.TimeoutException:
+            return "Connection timeout", True
+        except httpx.TransportError:
+            return "Connection error", True
+        except httpx.HTTPError as e:
+            return f"Request error: {str(e)}", False
+    
+    return await head_with_retries(limiter, URL_TMPL % (event_code, filename), head)
+
+async def check_all_http2(filenames, event_code):
+    """Check all filenames multiplexed over HTTP/2, or return None if unsupported"""
+    client = await open_http2_client()
+    if client is None:
+        return None
+    
+    limiter = AdaptiveLimiter(MAX_WORKERS)
+    async with client:
+        return await asyncio.gather(*(check_pdf_http2(client, limiter, f, event_code) for f in filenames))
+
+def run_async(coro):
+    """Run a coroutine like asyncio.run, on uvloop when it is installed"""
+    if uvloop is None:
+        return asyncio.run(coro)
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            return runner.run(coro)
+    uvloop.install()
+    return asyncio.run(coro)
+
+async def check_pdf_threaded(executor, limiter, filename, event_code, session=SESSION):
+    """Check one filename with a blocking requests HEAD run on a thread pool"""
+    def head_blocking(url):
+        try:
+            return session.head(url, timeout=10, allow_redirects=True).status_code
         except requests.exceptions.Timeout:
-            if attempt < max_retries:
-                print_colored(f"     ⏱️  Timeout (attempt {attempt}/{max_retries}), retrying in {retry_delay}s...", Fore.YELLOW)
-                time.sleep(retry_delay)
-            else:
-                return False, url, f"Connection timeout (failed after {max_retries} attempts)"
-                
+            return "Connection timeout", True
         except requests.exceptions.ConnectionError:
-            if attempt < max_retries:
-                print_colored(f"     🔌 Connection error (attempt {attempt}/{max_retries}), retrying in {retry_delay}s...", Fore.YELLOW)
-                time.sleep(retry_delay)
-            else:
-                return False, url, f"Connection error (failed after {max_retries} attempts)"
-                
+            return "Connection error", True
         except requests.exceptions.RequestException as e:
-            if attempt < max_retries:
-                print_colored(f"     ⚠️  Request error (attempt {attempt}/{max_retries}), retrying in {retry_delay}s...", Fore.YELLOW)
-                time.sleep(retry_delay)
-            else:
-                return False, url, f"Request error: {str(e)} (failed after {max_retries} attempts)"
+            return f"Request error: {str(e)}", False
     
-    # Should not reach here, but just in case
-    return False, url, "Unknown error"
+    loop = asyncio.get_running_loop()
+    
+    async def head(url):
+        return await loop.run_in_executor(executor, head_blocking, url)
+    
+    return await head_with_retries(limiter, URL_TMPL % (event_code, filename), head)
+
+async def check_all_threaded(filenames, event_code):
+    """Check all filenames on a thread pool sharing the pooled SESSION
+    
+    Only the HEAD requests run on the worker threads. Retries and backoff go
+    through head_with_retries on the event loop, so a worker is never held
+    while waiting to retry.
+    """
+    limiter = AdaptiveLimiter(MAX_WORKERS)
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+        return await asyncio.gather(*(check_pdf_threaded(ex, limiter, f, event_code) for f in filenames))
 
 def process_event(event_code):
     """Process a single event code"""
@@ -83,37 +348,25 @@ def process_event(event_code):
     print_colored(f"Processing event: {event_code}", Fore.CYAN, "📁")
     print_colored(f"CSV file: {csv_file}", Fore.CYAN)
     print_colored(f"Start time: {datetime.now().strftime('%H:%M:%S')}", Fore.CYAN)
-    print_colored(f"Retry policy: 3 attempts with 2s delay", Fore.CYAN, "🔄")
+    print_colored(f"Retry policy: up to {MAX_RETRIES} retries with exponential backoff", Fore.CYAN, "🔄")
     print_colored(f"{'='*60}", Fore.CYAN)
     
     try:
         with open(csv_file, 'r', encoding='utf-8') as file:
-            # Try to detect CSV dialect
-            sample = file.read(1024)
-            file.seek(0)
-            
-            # Check if file has header
-            has_header = csv.Sniffer().has_header(sample)
+            # Single pass: the first row decides whether there is a header
+            reader = csv.reader(file)
+            first_row = next(reader, [])
+            has_header = (any('email' in field.lower() for field in first_row)
+                          and not any('@' in field for field in first_row))
             
             if has_header:
-                reader = csv.DictReader(file)
                 # Find email column (case insensitive)
-                email_field = None
-                for field in reader.fieldnames:
-                    if 'email' in field.lower():
-                        email_field = field
-                        break
-                
-                if not email_field:
-                    print_colored("No email column found in CSV header!", Fore.RED, "❌")
-                    return False
-                    
-                emails = [row[email_field] for row in reader if row[email_field].strip()]
+                email_col = next(i for i, field in enumerate(first_row) if 'email' in field.lower())
+                emails = [row[email_col] for row in reader if len(row) > email_col and row[email_col].strip()]
             else:
                 # No header, assume emails are in a specific column
-                reader = csv.reader(file)
                 emails = []
-                for row in reader:
+                for row in itertools.chain([first_row], reader):
                     if len(row) > 1:  # Assuming email is in second column
                         emails.append(row[1].strip())
                     elif len(row) == 1:  # Only one column
@@ -133,101 +386,124 @@ def process_event(event_code):
         
         print()
         
-        results = []
+        # Filter out invalid emails up front, keeping their original position
+        to_check = []
         for idx, email in enumerate(emails, 1):
             if not email or '@' not in email:
                 print_colored(f"Skipping invalid email: {email}", Fore.YELLOW, "⚠️")
                 continue
-                
-            exists, url, message = check_pdf_exists(email, event_code)
-            
-            # Show the generated URL
-            url_filename = url.split('/')[-1]  # Just show the filename part
-            full_url_display = url  # Full URL for copy-paste
-            
+            to_check.append((idx, email.strip()))
+        
+        # Duplicate rows map to the same URL, so only check each email once.
+        # Not lowercased: the certificate filenames are case-sensitive.
+        pending = list(dict.fromkeys(email for _, email in to_check))
+        filenames = [email_to_filename(email) for email in pending]
+        
+        # Prefer HTTP/2 multiplexing, then aiohttp, then the thread pool
+        checked = None
+        if httpx is not None:
+            checked = run_async(check_all_http2(filenames, event_code))
+        if checked is None and aiohttp is not None:
+            checked = run_async(check_all_async(filenames, event_code))
+        if checked is None:
+            checked = run_async(check_all_threaded(filenames, event_code))
+        
+        # Buffer the per-email report and summary in memory and write them out
+        # in one go, so colorama's stream wrapper only handles a single write
+        out = io.StringIO()
+        emit = lambda text, color=Fore.WHITE, emoji="": out.write(format_colored(text, color, emoji))
+        
+        cache = {email: (filename, *result) for email, filename, result in zip(pending, filenames, checked)}
+        results = []
+        for idx, email in to_check:
+            filename, exists, url, message = cache[email]
             if exists:
-                print_colored(f"{idx:3d}. ✓ {email}", Fore.GREEN, "✅")
-                print_colored(f"     → {url_filename}", Fore.GREEN)
-                print_colored(f"     URL: {full_url_display}", Fore.GREEN)
-                print_colored(f"     Status: {message}", Fore.GREEN)
-                results.append((email, True, url, message))
+                color, mark, emoji = Fore.GREEN, "✓", "✅"
             else:
-                print_colored(f"{idx:3d}. ✗ {email}", Fore.RED, "❌")
-                print_colored(f"     → {url_filename}", Fore.RED)
-                print_colored(f"     URL: {full_url_display}", Fore.RED)
-                print_colored(f"     Status: {message}", Fore.RED)
-                results.append((email, False, url, message))
+                color, mark, emoji = Fore.RED, "✗", "❌"
+            emit(f"{idx:3d}. {mark} {email}", color, emoji)
+            emit(f"     → {filename}.pdf", color)
+            emit(f"     URL: {url}", color)
+            emit(f"     Status: {message}", color)
+            results.append((email, filename, exists, url, message))
             
             # Add a small separator between entries for readability
             if idx < len(emails):
-                print_colored(f"     {'─'*40}", Fore.LIGHTBLACK_EX)
+                emit(f"     {'─'*40}", Fore.LIGHTBLACK_EX)
         
         # Print summary
-        print_colored(f"\n{'='*60}", Fore.CYAN)
+        emit(f"\n{'='*60}", Fore.CYAN)
         total = len(results)
-        success = sum(1 for r in results if r[1])
+        success = sum(1 for r in results if r[2])
         failed = total - success
         
-        print_colored(f"SUMMARY for {event_code}:", Fore.CYAN, "📊")
-        print_colored(f"Total emails checked: {total}", Fore.WHITE)
-        print_colored(f"PDFs found: {success}", Fore.GREEN, "✅")
-        print_colored(f"PDFs not found: {failed}", Fore.RED, "❌")
+        emit(f"SUMMARY for {event_code}:", Fore.CYAN, "📊")
+        emit(f"Total emails checked: {total}", Fore.WHITE)
+        emit(f"PDFs found: {success}", Fore.GREEN, "✅")
+        emit(f"PDFs not found: {failed}", Fore.RED, "❌")
         
         # Show URL pattern and conversion rules
-        print_colored(f"\nURL Pattern and Conversion Rules:", Fore.CYAN, "🔗")
-        print_colored(f"Base URL: https://bbpvpbekasi.kemnaker.go.id/bulanvokasi/sertifikatbv/{event_code}/{{filename}}.pdf", Fore.WHITE)
-        print_colored(f"Conversion rules:", Fore.WHITE)
-        # print_colored(f"  1. Convert email to lowercase", Fore.WHITE)
-        print_colored(f"  1. Replace '@' with '_'", Fore.WHITE)
-        print_colored(f"  2. Keep '.com' as '.com' (don't change dots)", Fore.WHITE)
-        print_colored(f"  Example: DellaRamadhanty26@gmail.com → DellaRamadhanty26_gmail.com.pdf", Fore.WHITE)
+        emit(f"\nURL Pattern and Conversion Rules:", Fore.CYAN, "🔗")
+        emit(f"Base URL: {URL_TMPL % (event_code, '{filename}')}", Fore.WHITE)
+        emit(f"Conversion rules:", Fore.WHITE)
+        # emit(f"  1. Convert email to lowercase", Fore.WHITE)
+        emit(f"  1. Replace '@' with '_'", Fore.WHITE)
+        emit(f"  2. Keep '.com' as '.com' (don't change dots)", Fore.WHITE)
+        emit(f"  Example: DellaRamadhanty26@gmail.com → DellaRamadhanty26_gmail.com.pdf", Fore.WHITE)
         
         if success > 0:
             # Show first successful URL as example
-            for email, exists, url, message in results:
+            for email, filename, exists, url, message in results:
                 if exists:
-                    print_colored(f"\nExample successful URL:", Fore.GREEN)
-                    print_colored(f"{url}", Fore.GREEN)
+                    emit(f"\nExample successful URL:", Fore.GREEN)
+                    emit(f"{url}", Fore.GREEN)
                     break
         
         if failed > 0:
-            print_colored(f"\nFailed to find PDFs for:", Fore.YELLOW, "⚠️")
+            emit(f"\nFailed to find PDFs for:", Fore.YELLOW, "⚠️")
             failed_count = 0
-            for email, exists, url, message in results:
+            for email, filename, exists, url, message in results:
                 if not exists:
                     failed_count += 1
                     if failed_count <= 5:  # Show only first 5 failures
-                        print_colored(f"  • {email}", Fore.YELLOW)
-                        print_colored(f"    → {email_to_filename(email)}.pdf", Fore.YELLOW)
-                        print_colored(f"    URL: {url}", Fore.YELLOW)
+                        emit(f"  • {email}", Fore.YELLOW)
+                        emit(f"    → {filename}.pdf", Fore.YELLOW)
+                        emit(f"    URL: {url}", Fore.YELLOW)
                     elif failed_count == 6:
-                        print_colored(f"  ... and {failed - 5} more", Fore.YELLOW)
+                        emit(f"  ... and {failed - 5} more", Fore.YELLOW)
+        
+        sys.stdout.write(out.getvalue())
         
         # Save results to a log file
         log_file = f"{event_code}_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+        # Build the whole file in memory so it goes to disk in one write
+        buf = io.StringIO()
+        buf.write(f"Event: {event_code}\n")
+        buf.write(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        buf.write(f"Total: {total}, Found: {success}, Missing: {failed}\n\n")
+        buf.write("Email,Filename,Status,URL,Message\n")
+        csv.writer(buf, quoting=csv.QUOTE_ALL, lineterminator='\n').writerows(
+            (email, f"{filename}.pdf", "FOUND" if exists else "MISSING", url, message)
+            for email, filename, exists, url, message in results
+        )
         with open(log_file, 'w', encoding='utf-8') as f:
-            f.write(f"Event: {event_code}\n")
-            f.write(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Total: {total}, Found: {success}, Missing: {failed}\n\n")
-            f.write("Email,Filename,Status,URL,Message\n")
-            for email, exists, url, message in results:
-                status = "FOUND" if exists else "MISSING"
-                filename = email_to_filename(email) + ".pdf"
-                f.write(f'"{email}","{filename}","{status}","{url}","{message}"\n')
+            f.write(buf.getvalue())
         
         print_colored(f"\nDetailed results saved to: {log_file}", Fore.BLUE, "💾")
         
         # Also save a simple list of URLs for easy access
         urls_file = f"{event_code}_urls_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+        buf = io.StringIO()
+        buf.write(f"URLs for event: {event_code}\n")
+        buf.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        buf.write(f"Conversion: email → lowercase, @ → _, keep .com\n\n")
+        for email, filename, exists, url, message in results:
+            if exists:
+                buf.write(f"✓ {url}\n")
+            else:
+                buf.write(f"✗ {url}  # {message}\n")
         with open(urls_file, 'w', encoding='utf-8') as f:
-            f.write(f"URLs for event: {event_code}\n")
-            f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Conversion: email → lowercase, @ → _, keep .com\n\n")
-            for email, exists, url, message in results:
-                if exists:
-                    f.write(f"✓ {url}\n")
-                else:
-                    f.write(f"✗ {url}  # {message}\n")
+            f.write(buf.getvalue())
         
         print_colored(f"URL list saved to: {urls_file}", Fore.BLUE, "📄")
         
@@ -261,9 +537,14 @@ def main():
         print()
         
         print_colored("Available Event Codes:", Fore.YELLOW, "📋")
+        # One directory listing instead of a stat() per event code
+        # (normcase keeps this case-insensitive on Windows, like os.path.exists)
+        with os.scandir('.') as entries:
+            existing = {os.path.normcase(entry.name) for entry in entries
+                        if entry.name.lower().endswith('.csv')}
         for idx, code in enumerate(event_codes, 1):
             # Check if CSV file exists for this code
-            csv_exists = os.path.exists(f"{code}.csv")
+            csv_exists = os.path.normcase(f"{code}.csv") in existing
             status = "✓ CSV found" if csv_exists else "✗ CSV missing"
             color = Fore.GREEN if csv_exists else Fore.RED
             print_colored(f"  {idx}. {code} - {status}", color)
@@ -297,12 +578,14 @@ if __name__ == "__main__":
     # Install required packages if not already installed
     try:
         import requests
+        import aiohttp
         import colorama
     except ImportError:
         print("Installing required packages...")
         import subprocess
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "requests", "colorama"])
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "requests", "aiohttp", "colorama"])
         import requests
+        import aiohttp
         import colorama
         from colorama import init, Fore, Style
         init(autoreset=True)